@@ -3,6 +3,7 @@
 import numpy as np
 import numpy.lib.recfunctions as rfn
 import os, tempfile
+import inspect
 from functools import wraps
 from hashlib import md5
 
@@ -72,11 +73,19 @@ def cache(filename: str, create: callable=None, name=None, storage=None, **opts)
 
 def cachefunc(f):
 	''' Decorator to cache a function results.
-		
-		Use it if you want to cache their result associated with the argument set used 
+
+		Use it if you want to cache their result associated with the argument set used.
+		The cache is persisted to disk in `io.cachedir`, so results are reused across sessions.
+		Set the environment variable `PYMADCAD_NOCACHE` to disable it, for debug purpose.
 	'''
+	sig = inspect.signature(f)
 	@wraps(f)
 	def repl(*args, **kwargs):
+		if os.environ.get('PYMADCAD_NOCACHE'):
+			return f(*args, **kwargs)
+		# bind the call to the signature with its defaults, so every spelling of the same call shares one cache entry
+		bound = sig.bind(*args, **kwargs)
+		bound.apply_defaults()
 		if not os.path.exists(cachedir):
 			os.makedirs(cachedir)
 		key = '{}/{}{}-{}.pickle'.format(
@@ -84,10 +93,7 @@ def cachefunc(f):
 			f.__module__ + '.' if f.__module__ else '',
 			f.__name__,
 			hex(int.from_bytes(
-				md5(repr((
-					*args, 
-					sorted(list(kwargs.items()))
-					)).encode())
+				md5(repr(tuple(bound.arguments.items())).encode())
 					.digest(),
 				'little')),
 			)
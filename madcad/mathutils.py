@@ -8,6 +8,7 @@ del version, license
 import math
 from math import pi, inf, nan, atan2
 from copy import deepcopy
+import numpy as np
 max = __builtins__['max']
 min = __builtins__['min']
 any = __builtins__['any']
@@ -342,29 +343,26 @@ def imax(iterable, default=None):
 
 
 def linrange(start, stop=None, step=None, div=0, end=True):
-	''' yield successive intermediate values between start and stop 
-		
+	''' return an array of successive intermediate values between start and stop
+
 		stepping:
 		* if `step` is given, it will be the amount between raised value until it gets over `stop`
 		* if `div` is given, it will be the number of intermediate steps between `start` and `stop` (with linear spacing)
-		
+
 		ending:
 		* if `end` is True, it will stop iterate with value `stop` (or just before)
 		* if `end` is False, it will stop iterating just before `stop` and never with `stop`
-		
-		NOTE:  
+
+		NOTE:
 			If step is given and is not a multiple of `stop-start` then `end` has no influence
 	'''
 	if stop is None:	start, stop = 0, start
 	if step is None:	step = (stop-start)/(div+1)
 	elif step * (stop-start) < 0:	step = -step
 	if not end:			stop -= step
-	stop += NUMPREC*stop
-	
-	t = start
-	while t <= stop:
-		yield t
-		t += step
+
+	n = max(int((stop-start)/step * (1+NUMPREC)) + 1, 0)
+	return np.linspace(start, start + (n-1)*step, n)
 
 class Box:
 	''' This class describes a box always orthogonal to the base axis, used as convex for area delimitations 
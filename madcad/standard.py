@@ -12,19 +12,33 @@
 		>>> screw(8, 16, head='button', drive='slot')
 '''
 
-from operator import itemgetter
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from pickle import PicklingError
+
+import numpy as np
 
 from .mathutils import *
 from .primitives import *
 from .kinematic import Solid
-from .mesh import Mesh, Web, Wire, web, wire
+from .mesh import Mesh, Web, Wire, web, wire, numpy_to_typedlist
 from .generation import *
 from .blending import *
 from .boolean import pierce, union, difference, intersection
 from .cut import *
 from .io import cachefunc
 
-#cachefunc = lambda x:x	# debug purpose
+try:
+	from numba import njit
+except ImportError:
+	def njit(*args, **kwargs):
+		''' fallback decorator when numba is not installed: the decorated functions run as plain python over numpy '''
+		if args and callable(args[0]):
+			return args[0]
+		return lambda f: f
+
+# set the environment variable PYMADCAD_NOCACHE to disable the part cache, for debug purpose
 
 
 __all__ = [	'nut', 'screw', 'washer', 
@@ -32,6 +46,7 @@ __all__ = [	'nut', 'screw', 'washer',
 			'bearing', 'slidebearing',
 			'section_s', 'section_w', 'section_c', 'section_l', 'section_tslot',
 			'stfloor', 'stceil',
+			'build_many',
 			]
 
 			
@@ -91,10 +106,59 @@ def stceil(x, precision=0.1):
 		ratio *= base
 	raise RuntimeError('failed to converge, this is a bug')
 
+# --------- internal helpers -----------------------
+
+def _wire_from_array(arr, closed=False, reverse=False, segmented=False):
+	''' build a `Wire` from a `(n,3)` array of point coordinates, avoiding the cost of one `vec3` constructor call per point
+
+		`vec3` is a double precision vector, so a contiguous float64 array is handed to the point buffer without copy nor narrowing. Generators should produce float64 directly.
+		`reverse` emits the points in reversed order and `segmented` puts a group on each edge, producing at once what chaining `flip` and `segmented` would reallocate the wire for.
+	'''
+	if reverse:
+		arr = arr[::-1]
+	w = Wire(typedlist(np.ascontiguousarray(arr, dtype='f8'), dtype=vec3))
+	if closed:
+		w.close()
+	if segmented:
+		w.tracks = typedlist(np.arange(len(w.indices), dtype='u4'), dtype='I')
+		w.groups = [None] * len(w.indices)
+	return w
+
+def _web_from_array(arr, closed=False):
+	''' build a segmented `Web` from a `(n,3)` array of point coordinates, one group per edge
+
+		This is the equivalent of `web(wire([...]).segmented())` but the edge and track tables are generated as arrays, without intermediate `Wire`.
+	'''
+	n = len(arr) if closed else len(arr)-1
+	edges = np.empty((n,2), dtype='u4')
+	edges[:,0] = np.arange(n)
+	edges[:,1] = np.arange(1, n+1)
+	if closed:
+		edges[-1,1] = 0
+	return Web(
+			typedlist(np.ascontiguousarray(arr, dtype='f8'), dtype=vec3),
+			typedlist(edges, dtype=uvec2),
+			typedlist(np.arange(n, dtype='u4'), dtype='I'),
+			[None]*n,
+			)
+
+# unit hexagon vertices, counter-clockwise around Z starting at +X, and the clockwise variant with the same start vertex
+_hex_unit = np.array([[cos(k*pi/3), sin(k*pi/3), 0.]  for k in range(6)])
+_hex_unit_cw = np.roll(_hex_unit[::-1], 1, axis=0)
+# cosine of the hexagon facet half angle and its inverse, to convert between width across flats and corner radius
+_cos30 = cos(pi/6)
+_inv_cos30 = 1/_cos30
+
+def _hexagon(radius, z, up=True):
+	''' closed hexagonal `Wire` of circumscribed `radius` at height `z`, equivalent to `regon((z*Z, Z if up else -Z), radius, 6)` but scaling precomputed vertices instead of polygonizing a `Circle` '''
+	pts = (_hex_unit if up else _hex_unit_cw) * radius
+	pts[:,2] = z
+	return _wire_from_array(pts, closed=True, segmented=True)
+
+
 # --------- screw stuff -----------------------
+
 	
-	
-@cachefunc
 def screw(d, length, filet_length=None, head='SH', drive=None, detail=False) -> Solid:
 	''' create a standard screw using the given drive and head shapes
 	
@@ -127,17 +191,27 @@ def screw(d, length, filet_length=None, head='SH', drive=None, detail=False) ->
 		* see [here for a guide of what to use](https://www.homestratosphere.com/types-of-screws/)
 		* see wikipedia for [standard screw thread](https://en.wikipedia.org/wiki/ISO_metric_screw_thread)
 		
-		
+
 	'''
 	if filet_length is None:	filet_length = length - 0.05*d
 	elif length < filet_length:	raise ValueError('filet_length must be smaller than length')
-	
-	
+
 	head, drive = screw_spec(head, drive)
-	head = globals()['screwhead_'+head](d)
+	return _screw(d, length, filet_length, head, drive, detail)
+
+@cachefunc
+def _screw(d, length, filet_length, head, drive, detail):
+	# the arguments are already canonicalized by `screw`, so equivalent calls reuse the same cache entry
+	if head not in _screwheads:
+		raise ValueError('unknown head shape {}'.format(repr(head)))
+	if drive and drive not in _screwdrives:
+		raise ValueError('unknown drive shape {}'.format(repr(drive)))
 	if drive:
-		drive = globals()['screwdrive_'+drive](d) .transform(boundingbox(head).max[2]*Z)
-		head = intersection(head, drive)
+		# the head and drive shapes come from caches, so work on a copy: intersection mutates its operands
+		drive = _screwdrives[drive](d) .transform(_screwhead_top(head, d)*Z)
+		head = intersection(deepcopy(_screwheads[head](d)), drive)
+	else:
+		head = _screwheads[head](d)
 		
 	r = 0.5*d
 	axis = Axis(O, Z, interval=(-length,r))
@@ -151,65 +225,87 @@ def screw(d, length, filet_length=None, head='SH', drive=None, detail=False) ->
 	screw = (body + head).finish()
 	return Solid(part=screw, axis=axis)
 
+@lru_cache(maxsize=64)
 def screwdrive_torx(d):
 	indev
 	
+@lru_cache(maxsize=64)
 def screwdrive_hex(d):
-	base = regon((-0.3*d*Z, -Z), 0.5*d, 6)
+	base = _hexagon(0.5*d, -0.3*d, up=False)
 	socket = extrusion(d*Z, base) + blendloop(base, center=-0.6*d*Z, weight=-1)
 	socket.mergeclose()
 	return socket
 	
+@lru_cache(maxsize=64)
 def screwdrive_cross(d):
 	indev
 	
+@lru_cache(maxsize=64)
 def screwdrive_slot(d):
 	w = 0.15*d
 	h = 0.3*d
 	e = 2*d
-	return extrusion(2*e*X, web([
-				vec3(-e, w, h),
-				vec3(-e, w, -h),
-				vec3(-e, -w, -h),
-				vec3(-e, -w, h),
-				]) .segmented())
+	return extrusion(2*e*X, _web_from_array([
+				[-e, w, h],
+				[-e, w, -h],
+				[-e, -w, -h],
+				[-e, -w, h],
+				]))
 
+@lru_cache(maxsize=64)
 def screwhead_socket(d):
 	''' screw head shape for socket head (SH) '''
 	r = h = 0.7*d
 	c = 0.05*d
 	
-	profile = wire([
-			vec3(d/2,	0,	-c),
-			vec3(d/2+c,	0,	0),
-			vec3(r,     0,  0), 
-			vec3(r,     0,  h-c),
-			vec3(r-c,   0,  h),
-			vec3(0,     0,  h),
-			]) .segmented()
+	profile = _web_from_array([
+			[d/2,	0,	-c],
+			[d/2+c,	0,	0],
+			[r,     0,  0],
+			[r,     0,  h-c],
+			[r-c,   0,  h],
+			[0,     0,  h],
+			])
 	head = revolution(-2*pi, (O,Z), profile)
 	head.finish()
 	return head
 	
+def _hex_sectored(profile, hexagon, height):
+	''' intersection of a revolution of `profile` around Z with the hexagonal prism extruded from `hexagon`
+
+		The result is 6-fold symmetric, so only one 60° sector is computed with booleans, then replicated with rigid transforms.
+		Groups are those of `profile` followed by those of the prism facet.
+	'''
+	rev = revolution(pi/3, Axis(O,Z), profile)
+	ext = extrusion(height*Z, hexagon)
+	facet = extrusion(height*Z, Wire(hexagon.points, hexagon.indices[:2], None, hexagon.groups) .segmented())
+	sector = pierce(rev, ext, True) + pierce(facet, rev, True)
+	result = repeat(sector, 6, rotatearound(pi/3, Axis(O,Z)))
+	result.mergeclose()
+	return result
+
+@lru_cache(maxsize=64)
 def screwhead_hex(d):
 	''' screw head shape for hex head (HH) '''
 	r = 0.9*d
 	h = 0.6*d
 	c = 0.05*d
-	
-	profile = extrusion(2*d*Z, regon((-d*Z,Z), r, 6))
-	cone = revolution(2*pi, (O,Z), web([
-		vec3(0,       0, h),
-		vec3(0.8*r,   0, h),
-		vec3(1.01*r,  0, h*0.8),
-		vec3(1.01*r,  0, 0),
-		vec3(0.5*d+c, 0, 0),
-		vec3(0.5*d,   0, -c),
-		]) .segmented())
-	head = intersection(cone, profile)
+
+	head = _hex_sectored(
+			web([
+				vec3(0,       0, h),
+				vec3(0.8*r,   0, h),
+				vec3(1.01*r,  0, h*0.8),
+				vec3(1.01*r,  0, 0),
+				vec3(0.5*d+c, 0, 0),
+				vec3(0.5*d,   0, -c),
+				]) .segmented(),
+			_hexagon(r, -d),
+			2*d)
 	head.finish()
 	return head
 	
+@lru_cache(maxsize=64)
 def screwhead_button(d):
 	r = 0.95*d
 	h = 0.5*d
@@ -224,31 +320,53 @@ def screwhead_button(d):
 			vec3(0, 0.5*d, h), 
 			vec3(0, 0.9*r, h),
 			vec3(0, r, 0.1*d)),
-		wire([
-			vec3(0, r, 0.1*d),
-			vec3(0, r, 0),
-			vec3(0, 0.5*d+c, 0),
-			vec3(0, 0.5*d, -c),
+		_wire_from_array([
+			[0, r, 0.1*d],
+			[0, r, 0],
+			[0, 0.5*d+c, 0],
+			[0, 0.5*d, -c],
 			]) .segmented(),
 		]
 	return revolution(2*pi, (O,Z), profile)
 	
+@lru_cache(maxsize=64)
 def screwhead_flat(d):
 	r = d
 	h = 0.5*d
 	e = 0.1*d
 	
-	return revolution(2*pi, (O,Z), web([
-		vec3(0, 0, h+e),
-		vec3(0, r, h+e),
-		vec3(0, r, h),
-		vec3(0, 0.5*d, 0),
-		]) .segmented() )
+	return revolution(2*pi, (O,Z), _web_from_array([
+		[0, 0, h+e],
+		[0, r, h+e],
+		[0, r, h],
+		[0, 0.5*d, 0],
+		]) )
 	
+@lru_cache(maxsize=64)
 def screwhead_none(d):
 	indev
 
-	
+# dispatch tables for `screw`, cheaper and more explicit than looking up the module namespace
+_screwheads = {
+	'socket': screwhead_socket,
+	'hex': screwhead_hex,
+	'button': screwhead_button,
+	'flat': screwhead_flat,
+	'none': screwhead_none,
+	}
+_screwdrives = {
+	'hex': screwdrive_hex,
+	'torx': screwdrive_torx,
+	'cross': screwdrive_cross,
+	'slot': screwdrive_slot,
+	}
+
+@lru_cache(maxsize=64)
+def _screwhead_top(head, d):
+	''' z of the top of the given head shape, cached because computing it walks all the head points '''
+	return boundingbox(_screwheads[head](d)).max[2]
+
+
 '''
 	head shapes:
 	Abbreviation 	Expansion 	Comment
@@ -304,13 +422,15 @@ screwdrives_codes = {
 	'phillips': 'cross',
 	'P': 'cross',
 	'PH': 'cross',
-	'PH': 'cross',
 	}
 
+# longest codes first, so that a short code never shadows a longer one ending the same way
+_drive_suffixes = sorted(screwdrives_codes, key=len, reverse=True)
+
 def screw_spec(head, drive=None):
 	if not drive:
 		if head.isupper():
-			for code in screwdrives_codes:
+			for code in _drive_suffixes:
 				if head.endswith(code):
 					head, drive = head[:-len(code)], code
 					break
@@ -320,13 +440,15 @@ def screw_spec(head, drive=None):
 	# special cases
 	if head != 'hex' and not drive:
 		drive = 'hex'
-		
+	elif head == 'hex' and drive == 'hex':
+		# the outer hex shape is already the driver, no socket to carve
+		drive = None
+
 	return head, drive
 
 
 # ------------------- nut stuff ----------------------
 
-@cachefunc
 def nut(d, type='hex', detail=False) -> Solid:
 	''' create a standard nut model using the given shape type 
 	
@@ -339,33 +461,66 @@ def nut(d, type='hex', detail=False) -> Solid:
 		
 		Currently only shape 'hex' is available.
 	'''
-	args = standard_hexnuts[bisect(standard_hexnuts, d, key=itemgetter(0))]
-	if args[0] != d:
+	i = np.searchsorted(_nut_d, d)
+	if i >= len(_nut_d) or _nut_d[i] != d:
 		raise ValueError('no standard nut for the given diameter')
-	return hexnut(*args)
+	return hexnut(float(_nut_d[i]), float(_nut_w[i]), float(_nut_h[i]))
 
-	
+
+@njit(cache=True, fastmath=True)
+def _hexnut_rings(d, w, h, ts):
+	''' point grid of the hexnut surface, as 6 rings sampled at angles `ts`, `w` being the half width across flats
+
+		The profile radius at the corners exceeds the prism corner radius, so its outer cylindrical band lies entirely outside the prism and the nut surface reduces to strips between 6 closed rings: the top bore circle, the top cone start circle, the two scalloped curves where the cones cross the facet planes, then the two mirrored bottom circles.
+	'''
+	a = 0.5*d
+	b = 0.95*w
+	r = 1.01 * w * _inv_cos30
+	slope = (r-w) / (r-b)
+	# radial distance of the facet planes, and z of the cone at that distance
+	rho = w / np.cos(ts % (pi/3) - pi/6)
+	zc = 0.5*h - (rho - b)*slope
+	n = len(ts)
+	cs, sn = np.cos(ts), np.sin(ts)
+	rings = np.empty((6, n, 3))
+	rings[0,:,0] = a*cs;	rings[0,:,1] = a*sn;	rings[0,:,2] = 0.5*h
+	rings[1,:,0] = b*cs;	rings[1,:,1] = b*sn;	rings[1,:,2] = 0.5*h
+	rings[2,:,0] = rho*cs;	rings[2,:,1] = rho*sn;	rings[2,:,2] = zc
+	rings[3,:,0] = rho*cs;	rings[3,:,1] = rho*sn;	rings[3,:,2] = -zc
+	rings[4,:,0] = b*cs;	rings[4,:,1] = b*sn;	rings[4,:,2] = -0.5*h
+	rings[5,:,0] = a*cs;	rings[5,:,1] = a*sn;	rings[5,:,2] = -0.5*h
+	return rings
+
+def _hexnut_swept(d, w, h):
+	''' mesh the hexnut surface directly from its analytic boundary curves, without any boolean
+
+		This is equivalent to intersecting the revolution of the nut profile with its hexagonal prism, but the intersection curves are known in closed form so the rings from `_hexnut_rings` are simply joined by triangle strips. Strips are numbered as the profile edges were, so the frontiers to chamfer are unchanged.
+	'''
+	r = 1.01 * 0.5*w * _inv_cos30
+	# one angle grid shared by all rings, with samples exactly on the prism corners
+	m = settings.curve_resolution(pi/3*r, pi/3) + 1
+	n = 6*m
+	ts = np.arange(n) * (pi/3/m)
+	rings = _hexnut_rings(d, 0.5*w, h, ts)
+
+	j = np.arange(n)
+	j1 = (j+1) % n
+	faces = np.empty((6, 2*n, 3), dtype='u4')
+	for i in range(6):
+		ia, ib = i*n, ((i+1) % 6)*n
+		faces[i, 0::2, 0] = ia + j;		faces[i, 0::2, 1] = ib + j;		faces[i, 0::2, 2] = ib + j1
+		faces[i, 1::2, 0] = ia + j;		faces[i, 1::2, 1] = ib + j1;	faces[i, 1::2, 2] = ia + j1
+	return Mesh(
+			typedlist(rings.reshape(-1,3), dtype=vec3),
+			numpy_to_typedlist(faces.reshape(-1,3), uvec3),
+			typedlist(np.repeat(np.arange(6, dtype='u4'), 2*n), dtype='I'),
+			[None]*6,
+			)
+
+@cachefunc
 def hexnut(d, w, h) -> Solid:
 	''' create an hexagon nut with custom dimensions '''
-	# revolution profile
-	w *= 0.5
-	r = 1.01 * w/cos(radians(30))
-	profile = wire([
-		vec3(0.5*d,	0,	0.5*h),
-		vec3(0.95*w,	0,	0.5*h),
-		vec3(r,	0,	0.5*h - (r-w)),
-		vec3(r,	0,	-0.5*h + (r-w)),
-		vec3(0.95*w,	0,	-0.5*h),
-		vec3(0.5*d,	0,	-0.5*h),
-		]) .close() .segmented()
-	base = revolution(2*pi, Axis(O,Z), web(profile))
-	
-	# exterior hexagon shape
-	hexagon = regon((-h*Z,Z),  w/cos(radians(30)), 6)
-	ext = extrusion(2*h*Z, hexagon)
-	
-	# intersect everything
-	nut = intersection(base, ext)
+	nut = _hexnut_swept(d, w, h)
 	chamfer(nut, nut.frontiers(4,5) + nut.frontiers(0,5), ('width', d*0.1))
 
 	nut.finish()
@@ -412,11 +567,14 @@ standard_hexnuts = [
 	(60,   90,  48), # non-prefered
 	(64,   95,  51),
 	]
-	
+
+# structure-of-arrays columns of the table, searched in C instead of probing tuples
+_nut_arr = np.array(standard_hexnuts)
+_nut_d, _nut_w, _nut_h = _nut_arr[:,0], _nut_arr[:,1], _nut_arr[:,2]
+
 	
 # -------------- washer stuff ----------------------
 	
-@cachefunc
 def washer(d, e=None, h=None) -> Solid:
 	''' create a standard washer.
 		Washers are useful to offset screws and avoid them to scratch the mount part
@@ -430,16 +588,19 @@ def washer(d, e=None, h=None) -> Solid:
 		If `d` alone is given, the other parameters default to the ISO specs: https://www.engineersedge.com/iso_flat_washer.htm
 	'''
 	if e is None and h is None:
-		args = standard_washers[bisect(standard_washers, d, key=itemgetter(0))]
-		if abs(args[0] - d)/d < 0.2:
-			_, d, e, h = args
-		else:
-			raise ValueError('no standard nut for the given diameter')
+		i = np.searchsorted(_washer_d, d)
+		if i >= len(_washer_d) or _washer_d[i] != d:
+			raise ValueError('no standard washer for the given diameter')
+		d, e, h = float(_washer_int[i]), float(_washer_ext[i]), float(_washer_h[i])
 	else:
 		d *= 1.1
 		if e is None:	e = d*2
 		if h is None:	h = d*0.1
-	
+	return _washer(d, e, h)
+
+@cachefunc
+def _washer(d, e, h):
+	# the arguments are already canonicalized by `washer`, so equivalent calls reuse the same cache entry
 	surf = blendpair(
 			Circle((O,-Z), d/2), 
 			Circle((O,Z), e/2),
@@ -490,7 +651,11 @@ standard_washers	= [
 	(52,  54,  98,  8),
 	(56,  58,  105, 9),
 	]
-	
+
+# structure-of-arrays columns of the table, searched in C instead of probing tuples
+_washer_arr = np.array(standard_washers)
+_washer_d, _washer_int, _washer_ext, _washer_h = (_washer_arr[:,i]  for i in range(4))
+
 	
 def section_s(height=1, width=None, flange=None, thickness=None) -> Web:
 	''' standard S (short flange) section. Very efficient to support flexion efforts.
@@ -645,7 +810,28 @@ standard_ipn = [
 	
 # --------------------- coilspring stuff ------------------------
 
-@cachefunc
+@njit(cache=True, fastmath=True)
+def _coil_segment(xs, ys, ts, start, stop, z0, t0, pitch):
+	''' helix segment coordinates taken from shared trig values, z raising by `pitch` per turn from `z0` at angle `t0` '''
+	pts = np.empty((stop - start, 3))
+	pts[:,0] = xs[start:stop]
+	pts[:,1] = ys[start:stop]
+	pts[:,2] = z0 + (ts[start:stop] - t0) * (pitch/(2*pi))
+	return pts
+
+@njit(cache=True, fastmath=True)
+def _helix(r, ts, z0, t0, pitch, phase=0.):
+	''' vectorized helix coordinates of radius `r` at angles `ts`, z raising by `pitch` per turn from `z0` '''
+	if phase:
+		angles = ts + phase
+	else:
+		angles = ts
+	pts = np.empty((len(ts), 3))
+	pts[:,0] = r * np.cos(angles)
+	pts[:,1] = r * np.sin(angles)
+	pts[:,2] = z0 + (ts - t0) * (pitch/(2*pi))
+	return pts
+
 def coilspring_compression(length, d=None, thickness=None, solid=True) -> Solid:
 	''' return a Mesh model of a croilspring meant for use in compression
 	
@@ -657,29 +843,29 @@ def coilspring_compression(length, d=None, thickness=None, solid=True) -> Solid:
 	'''
 	if not d:			d = length*0.2
 	if not thickness:	thickness = d*0.1
+	return _coilspring_compression(length, d, thickness, solid)
+
+@cachefunc
+def _coilspring_compression(length, d, thickness, solid):
+	# the arguments are already canonicalized by `coilspring_compression`, so equivalent calls reuse the same cache entry
 	r = d/2 - thickness		# coil radius
 	e = r					# coil step
 	div = settings.curve_resolution(d*pi, 2*pi)
 	step = 2*pi/(div+1)
 	
-	t = 0
-	
-	t0, z0 = t, -0.5*length
-	top = []
-	for t in linrange(t0, t0 + 4*pi, step):
-		top.append( vec3(r*cos(t), r*sin(t), z0 + (t-t0)/(2*pi) * thickness) )
-	
-	t0, z0 = t, -0.5*length + 2*thickness
-	coil = []
-	for t in linrange(t0, t0 + 2*pi * (length-4*thickness) / e, step):
-		coil.append( vec3(r*cos(t), r*sin(t), z0 + (t-t0)/(2*pi) * e) )
-	
-	t0, z0 = t, 0.5*length - 2*thickness
-	bot = []
-	for t in linrange(t0, t0 + 4*pi, step):
-		bot.append( vec3(r*cos(t), r*sin(t), z0 + (t-t0)/(2*pi) * thickness) )
-		
-	path = Wire(top) + Wire(coil).qualify('spring') + Wire(bot)
+	# the three segments are contiguous and share radius and angular resolution, so their trig values are computed in a single batch
+	n1 = int(4*pi/step * (1+NUMPREC)) + 1							# samples of each tightened end
+	n2 = int(2*pi * (length-4*thickness) / e / step * (1+NUMPREC)) + 1	# samples of the active coil
+	ts = np.arange(2*(n1-1) + n2) * step
+	xs = r * np.cos(ts)
+	ys = r * np.sin(ts)
+
+	# each segment restarts its z ramp where the previous one stopped, and owns the junction sample alone so the path never carries a zero-length segment
+	top = _coil_segment(xs, ys, ts, 0, n1, -0.5*length, ts[0], thickness)
+	coil = _coil_segment(xs, ys, ts, n1, n1-1+n2, -0.5*length + 2*thickness, ts[n1-1], e)
+	bot = _coil_segment(xs, ys, ts, n1+n2-1, n1+n2-2+n1, 0.5*length - 2*thickness, ts[n1+n2-2], thickness)
+
+	path = _wire_from_array(top) + _wire_from_array(coil).qualify('spring') + _wire_from_array(bot)
 	
 	if not solid:
 		return path
@@ -698,7 +884,6 @@ def coilspring_compression(length, d=None, thickness=None, solid=True) -> Solid:
 			bottom=-0.5*length*Z,
 			)
 	
-@cachefunc
 def coilspring_tension(length, d=None, thickness=None, solid=True) -> Solid:
 	''' return a Mesh model of a croilspring meant for use in tension 
 	
@@ -710,9 +895,14 @@ def coilspring_tension(length, d=None, thickness=None, solid=True) -> Solid:
 	'''
 	if not d:			d = length*0.2
 	if not thickness:	thickness = d*0.1
+	return _coilspring_tension(length, d, thickness, solid)
+
+@cachefunc
+def _coilspring_tension(length, d, thickness, solid):
+	# the arguments are already canonicalized by `coilspring_tension`, so equivalent calls reuse the same cache entry
 	r = d/2 - thickness		# coil radius
 	e = r					# coil step
-	
+
 	# separate the coilspring in 3 parts:  the coil and the 2 hooks at both ides
 	spring_length = length - 2*r
 	ncoil = floor(spring_length / thickness) - 0.5
@@ -722,8 +912,8 @@ def coilspring_tension(length, d=None, thickness=None, solid=True) -> Solid:
 	div = settings.curve_resolution(d*pi, 2*pi)
 	step = 2*pi/(div+1)
 	z0 = -0.5 * ncoil * thickness
-	coil = Wire([	vec3(r*cos(t), r*sin(t), z0 + t/(2*pi) * thickness)
-					for t in linrange(0, 2*pi * ncoil, step) ]) .qualify('spring')
+	ts = np.arange(0., 2*pi * ncoil * (1+NUMPREC), step)
+	coil = _wire_from_array(_helix(r, ts, z0, 0., thickness)) .qualify('spring')
 	# create path with hooks
 	path = wire([
 				ArcCentered((-0.5*length*Z, X), vec3(0, -r, -0.5*length), -hold*Z),
@@ -749,8 +939,7 @@ def coilspring_tension(length, d=None, thickness=None, solid=True) -> Solid:
 			bottom=-0.5*length*Z,
 			)
 	
-@cachefunc
-def coilspring_torsion(arm, 
+def coilspring_torsion(arm,
 			angle=radians(45), 
 			d=None, 
 			length=None, 
@@ -771,10 +960,15 @@ def coilspring_torsion(arm,
 	if not d:			d = arm
 	if not thickness:	thickness = d*0.1
 	if not hook:		hook = -length
+	return _coilspring_torsion(arm, angle, d, length, thickness, hook, solid)
+
+@cachefunc
+def _coilspring_torsion(arm, angle, d, length, thickness, hook, solid):
+	# the arguments are already canonicalized by `coilspring_torsion`, so equivalent calls reuse the same cache entry
 	r = d/2 - thickness		# coil radius
 	e = r					# coil step
 	angle = pi - angle
-	
+
 	# separate the coilspring in 3 parts:  the coil and the 2 hooks at both ides
 	ncoil = ceil(length / thickness) + angle/(2*pi)
 	
@@ -782,8 +976,8 @@ def coilspring_torsion(arm,
 	div = settings.curve_resolution(d*pi, 2*pi)
 	step = 2*pi/(div+1)
 	z0 = -0.5 * ncoil * thickness
-	coil = Wire([	vec3(-r*sin(t), r*cos(t), z0 + t/(2*pi) * thickness)
-					for t in linrange(0, 2*pi * ncoil, step) ]) .qualify('spring')
+	ts = np.arange(0., 2*pi * ncoil * (1+NUMPREC), step)
+	coil = _wire_from_array(_helix(r, ts, z0, 0., thickness, phase=0.5*pi)) .qualify('spring')
 				
 	# create hooks
 	c = thickness * sign(hook)
@@ -795,11 +989,8 @@ def coilspring_torsion(arm,
 			vec3(arm-abs(c), 0, 0),
 			vec3(0),
 			]) .transform(coil[0])
-	bot = (top 
-			.flip() 
-			.transform(scaledir(Z,-1)*scaledir(X,-1)) 
-			.transform(angleAxis(angle, Z))
-			)
+	# fold the mirror and rotation into one matrix, so the points are transformed only once
+	bot = top .flip() .transform(mat3(angleAxis(angle, Z)) * scaledir(Z,-1) * scaledir(X,-1))
 	
 	# create path
 	path = top + coil + bot
@@ -921,20 +1112,20 @@ def bearing_ball(dint, dext=None, h=None, sealing=False, detail=False) -> Solid:
 
 	# outer rings profiles
 	axis = Axis(O,Z, interval=(0,h))
-	interior = Wire([
-		vec3(rint+e, 0,	w), 
-		vec3(rint, 0, w),
-		vec3(rint,	0,	-w),
-		vec3(rint+e, 0,	-w), 
-		]) .segmented() .flip()
+	interior = _wire_from_array([
+		[rint+e, 0,	w],
+		[rint, 0, w],
+		[rint,	0,	-w],
+		[rint+e, 0,	-w],
+		], reverse=True, segmented=True)
 	bevel(interior, [1, 2], ('radius',c), resolution=('div',1))
 
-	exterior = Wire([
-		vec3(rext-e,	0, -w),
-		vec3(rext, 0, -w),
-		vec3(rext, 0, w),
-		vec3(rext-e,	0, w),
-		]) .segmented() .flip()
+	exterior = _wire_from_array([
+		[rext-e,	0, -w],
+		[rext, 0, -w],
+		[rext, 0, w],
+		[rext-e,	0, w],
+		], reverse=True, segmented=True)
 	bevel(exterior, [1,2], ('radius',c), resolution=('div',1))
 
 	if detail and not sealing:
@@ -949,7 +1140,7 @@ def bearing_ball(dint, dext=None, h=None, sealing=False, detail=False) -> Solid:
 		part = revolution(2*pi, axis, web([exterior, interior])) .option(color=bearing_color)
 
 		nb = int(0.7 * pi*rb/rr)	# number of balls that can fit in
-		balls = repeat(icosphere(rb*X, rr), nb, angleAxis(radians(360)/nb, Z)) .option(color=vec3(0,0.1,0.2))
+		balls = repeat(icosphere(rb*X, rr), nb, angleAxis(2*pi/nb, Z)) .option(color=vec3(0,0.1,0.2))
 		
 		# balls cage (simplified version)
 		cage_profile = Wire([vec3(
@@ -1114,20 +1305,20 @@ def bearing_thrust(dint, dext, h, detail=False) -> Solid:
 
 	# rings outlines
 	axis = Axis(O,Z, interval=(0,h))
-	top = Wire([
-		vec3(rext, 0, w-e), 
-		vec3(rext, 0, w),
-		vec3(rint, 0, w),
-		vec3(rint, 0, w-e), 
-		]) .segmented() .flip()
+	top = _wire_from_array([
+		[rext, 0, w-e],
+		[rext, 0, w],
+		[rint, 0, w],
+		[rint, 0, w-e],
+		], reverse=True, segmented=True)
 	bevel(top, [1, 2], ('radius',c), resolution=('div',1))
 
-	bot = Wire([
-		vec3(rint, 0, -w+e),
-		vec3(rint, 0, -w),
-		vec3(rext, 0, -w),
-		vec3(rext, 0, -w+e),
-		]) .segmented() .flip()
+	bot = _wire_from_array([
+		[rint, 0, -w+e],
+		[rint, 0, -w],
+		[rext, 0, -w],
+		[rext, 0, -w+e],
+		], reverse=True, segmented=True)
 	bevel(bot, [1,2], ('radius',c), resolution=('div',1))
 
 	if detail:
@@ -1144,7 +1335,7 @@ def bearing_thrust(dint, dext, h, detail=False) -> Solid:
 		
 		# number of balls to place
 		nb = int(0.8 * pi*rb/rr)
-		balls = repeat(icosphere(rb*X, rr), nb, angleAxis(radians(360)/nb, Z))
+		balls = repeat(icosphere(rb*X, rr), nb, angleAxis(2*pi/nb, Z))
 		balls.option(color=bearing_circulating_color)
 		
 		# cage
@@ -1236,6 +1427,33 @@ def slidebearing(dint, h=None, thickness=None, shoulder=None, opened=False) -> S
 	chamfer(part, line, ('width',0.5*thickness))
 	return Solid(part=part, axis=axis)
 
+
+# ----------------------- batch stuff --------------------------
+
+def build_many(specs) -> list:
+	''' build many independent parts at once, using all the processor cores
+
+		Each spec is a `(callable, args, kwargs)` tuple whose trailing elements are optional. The calls are dispatched to a pool of worker processes so the expensive mesh operations of independent parts run in parallel, and the results are returned in the order of `specs`.
+
+		If a function or one of its results cannot be pickled to cross the process boundary, the whole batch is rerun on a thread pool instead: the heavy numeric work mostly releases the GIL so threads still overlap.
+
+		Example:
+
+			>>> fastening = build_many([
+			...		(screw, (3, 8)),
+			...		(nut, (3,)),
+			...		(washer, (3,)),
+			...		])
+	'''
+	calls = [(spec[0], spec[1] if len(spec) > 1 else (), spec[2] if len(spec) > 2 else {})
+				for spec in specs]
+	try:
+		with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+			return [future.result()  for future in [pool.submit(f, *args, **kwargs)  for f, args, kwargs in calls]]
+	except (PicklingError, TypeError, AttributeError):
+		with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+			return [future.result()  for future in [pool.submit(f, *args, **kwargs)  for f, args, kwargs in calls]]
+
 '''
 * profilés
 	+ ipn
@@ -11,30 +11,61 @@ assert stceil(877.2) == 1000
 assert stceil(877.2, 1e-2) == 880
 assert stceil(877.2, 1e-3) == 878
 
+# the tube solid degenerates to NaN if the spring path carries a zero-length segment
+for length in (15, 20, 24, 30):
+	assert isfinite(coilspring_compression(length)['part'].volume())
+
 d = 3
-show([
-	screw(d,12,10, head='BH'),
-	nut(d) .transform(vec3(0,0,-7)),
-	washer(d) .transform(vec3(0,0,-5)),
-	
-	screw(5,12, head='SH') .transform(vec3(10,0,0)),
-	nut(5) .transform(vec3(10,0,-5)),
-	
-	screw(4,12, head='VH', drive='slot') .transform(vec3(-10,0,0)),
-	nut(4) .transform(vec3(-10,0,-5)),
-	
-	coilspring_compression(20) .transform(vec3(0,10,0)),
-	coilspring_tension(20) .transform(vec3(10,10,0)),
-	coilspring_torsion(5) .transform(vec3(-10,10,0)),
-	
-	bearing(12, circulating='roller', contact=radians(20)) .transform(vec3(0,-30,0)),
-	bearing(12, circulating='roller', contact=radians(20), detail=True) .transform(vec3(0,-30,20)),
-	bearing(10, circulating='roller', contact=0, detail=True) .transform(vec3(0,-30,-20)),
-	bearing(12, circulating='ball') .transform(vec3(30,-30,0)),
-	bearing(12, circulating='ball', detail=True) .transform(vec3(30,-30,20)),
-	bearing(12, contact=radians(90)) .transform(vec3(-30,-30,0)),
-	bearing(12, contact=radians(90), detail=True) .transform(vec3(-30,-30,20)),
-	
-	slidebearing(10, shoulder=3) .transform(vec3(0, -60, 0)),
-	slidebearing(10, opened=True) .transform(vec3(-20, -60, 0)),
+# the parts are independent, so they are built in parallel before being placed
+parts = build_many([
+	(screw, (d,12,10), {'head':'BH'}),
+	(nut, (d,)),
+	(washer, (d,)),
+
+	(screw, (5,12), {'head':'SH'}),
+	(nut, (5,)),
+
+	(screw, (4,12), {'head':'VH', 'drive':'slot'}),
+	(nut, (4,)),
+
+	(coilspring_compression, (20,)),
+	(coilspring_tension, (20,)),
+	(coilspring_torsion, (5,)),
+
+	(bearing, (12,), {'circulating':'roller', 'contact':radians(20)}),
+	(bearing, (12,), {'circulating':'roller', 'contact':radians(20), 'detail':True}),
+	(bearing, (10,), {'circulating':'roller', 'contact':0, 'detail':True}),
+	(bearing, (12,), {'circulating':'ball'}),
+	(bearing, (12,), {'circulating':'ball', 'detail':True}),
+	(bearing, (12,), {'contact':radians(90)}),
+	(bearing, (12,), {'contact':radians(90), 'detail':True}),
+
+	(slidebearing, (10,), {'shoulder':3}),
+	(slidebearing, (10,), {'opened':True}),
 	])
+show([part.transform(position)  for part, position in zip(parts, [
+	vec3(0,0,0),
+	vec3(0,0,-7),
+	vec3(0,0,-5),
+
+	vec3(10,0,0),
+	vec3(10,0,-5),
+
+	vec3(-10,0,0),
+	vec3(-10,0,-5),
+
+	vec3(0,10,0),
+	vec3(10,10,0),
+	vec3(-10,10,0),
+
+	vec3(0,-30,0),
+	vec3(0,-30,20),
+	vec3(0,-30,-20),
+	vec3(30,-30,0),
+	vec3(30,-30,20),
+	vec3(-30,-30,0),
+	vec3(-30,-30,20),
+
+	vec3(0, -60, 0),
+	vec3(-20, -60, 0),
+	])])